@@ -0,0 +1,45 @@
+//! Rust backend for the packed anagram hash.
+//!
+//! The mask-and-accumulate loop below is simple enough for LLVM to
+//! auto-vectorize (NEON/AVX2 depending on target-cpu), so this backend
+//! gets SIMD throughput without hand-written intrinsics and is portable
+//! across x86_64 and aarch64.
+//!
+//! Optional: build with maturin (`maturin develop --release`) or
+//! `cargo build --release` and place the cdylib on the Python path as
+//! `packed_anagram_hash_rs`.  The Python hasher falls back transparently
+//! when the module is absent.
+
+use pyo3::prelude::*;
+
+/// Packed anagram hash of an ASCII byte string.
+///
+/// `shifts` holds the 26 per-letter shift values (1 << offset).  Counts
+/// are accumulated per letter, then folded with one multiply-add per
+/// letter; arithmetic wraps at 64 bits, matching the register semantics
+/// of the other backends.
+#[pyfunction]
+fn packed_hash(word: &[u8], shifts: Vec<u64>) -> PyResult<u64> {
+    if shifts.len() < 26 {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            "shifts must hold 26 values",
+        ));
+    }
+    let mut counts = [0u64; 26];
+    for &b in word {
+        let x = (b | 0x20).wrapping_sub(b'a');
+        if x < 26 {
+            counts[x as usize] += 1;
+        }
+    }
+    Ok(counts
+        .iter()
+        .zip(shifts.iter())
+        .fold(0u64, |h, (&n, &s)| h.wrapping_add(n.wrapping_mul(s))))
+}
+
+#[pymodule]
+fn packed_anagram_hash_rs(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_function(wrap_pyfunction!(packed_hash, m)?)?;
+    Ok(())
+}
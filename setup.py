@@ -0,0 +1,33 @@
+"""
+Optional in-place build of the Cython accelerator.
+
+The package installs pure-Python via hatchling (see pyproject.toml); this
+script only exists for building the ``_hasher`` extension locally:
+
+    pip install cython
+    python setup.py build_ext --inplace
+    # or: cythonize -i src/packed_anagram_hash/_hasher.pyx
+"""
+
+from setuptools import Extension, setup
+from Cython.Build import cythonize
+
+# The C backend compiles portably as scalar code; pass CFLAGS="-mavx2"
+# (or -march=native) to enable the 32-bytes-per-iteration AVX2 kernel.
+setup(
+    ext_modules=cythonize(
+        [
+            Extension(
+                "packed_anagram_hash._hasher",
+                ["src/packed_anagram_hash/_hasher.pyx"],
+            )
+        ],
+        language_level=3,
+    )
+    + [
+        Extension(
+            "packed_anagram_hash._hasher_simd",
+            ["src/packed_anagram_hash/_hasher_simd.c"],
+        )
+    ],
+)
@@ -0,0 +1,28 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Cython accelerator for the packed anagram hash inner loop.
+
+Optional: build in place with ``python setup.py build_ext --inplace``
+(or ``cythonize -i src/packed_anagram_hash/_hasher.pyx``).
+``hasher`` falls back to its pure-Python loop when this module is absent.
+"""
+
+from libc.stdint cimport uint64_t
+
+
+cpdef uint64_t packed_hash(const unsigned char[::1] buf,
+                           const uint64_t[::1] shifts):
+    """Accumulate per-letter shifts over an ASCII byte buffer.
+
+    Case is folded with ``| 0x20``; the unsigned compare after subtracting
+    ord('a') rejects every non-letter byte in one branch.
+    """
+    cdef Py_ssize_t i, n = buf.shape[0]
+    cdef uint64_t h = 0
+    cdef unsigned int d
+    with nogil:
+        for i in range(n):
+            d = (buf[i] | 0x20) - 97
+            if d < 26:
+                h += shifts[d]
+    return h
@@ -6,8 +6,142 @@ A constant-time comparison algorithm for anagram equivalence.
 Paper: https://doi.org/10.5281/zenodo.18167975
 """
 
+import functools
+from array import array
 from typing import Iterable, Dict, List
-from collections import defaultdict
+from collections import Counter, defaultdict
+
+try:
+    import numpy as _np
+except ImportError:  # numpy is optional; pure-Python paths remain available
+    _np = None
+
+try:
+    from . import _hasher as _chasher  # Cython accelerator, built via setup.py
+except ImportError:
+    _chasher = None
+
+try:
+    from . import _hasher_simd as _simd  # C/AVX2 accelerator
+except ImportError:
+    _simd = None
+
+try:
+    import packed_anagram_hash_rs as _rust  # PyO3 accelerator (rust/)
+except ImportError:
+    _rust = None
+
+
+def _build_numba_kernels():
+    """Compile JIT kernels for the per-byte inner loops.
+
+    Returns (letter_counts, packed_hash) or (None, None) when numba is
+    unavailable.  Kernels take a uint8 view of the ASCII bytes; case is
+    folded branchlessly with ``| 0x20`` and non-letters are skipped via a
+    single unsigned compare.
+    """
+    if _np is None:
+        return None, None
+    try:
+        from numba import njit
+    except ImportError:
+        return None, None
+
+    @njit(cache=True, boundscheck=False)
+    def letter_counts(buf):
+        counts = _np.zeros(26, dtype=_np.uint32)
+        for i in range(buf.size):
+            c = buf[i] | 0x20
+            if 96 < c < 123:
+                counts[c - 97] += 1
+        return counts
+
+    @njit(cache=True, boundscheck=False)
+    def packed_hash(buf, shifts):
+        h = _np.uint64(0)
+        for i in range(buf.size):
+            c = buf[i] | 0x20
+            if 96 < c < 123:
+                h += shifts[c - 97]
+        return h
+
+    return letter_counts, packed_hash
+
+
+_letter_counts_nb, _packed_hash_nb = _build_numba_kernels()
+
+# bytes.translate tables: _NON_ALPHA deletes every byte that is not an
+# ASCII letter, _CASE_FOLD maps A-Z onto a-z.  Together they canonicalize
+# a byte string in one C-level pass with a single output allocation.
+_NON_ALPHA = bytes(
+    c for c in range(256) if not (65 <= c <= 90 or 97 <= c <= 122)
+)
+_CASE_FOLD = bytes(c | 0x20 if 65 <= c <= 90 else c for c in range(256))
+
+
+def _bit_budget(max_freq) -> int:
+    """Total packed bits needed for a vector of per-letter maxima."""
+    return sum(
+        max(1, int(f).bit_length()) if f > 0 else 0 for f in max_freq
+    )
+
+
+def _check_bit_budget(total_bits: int) -> None:
+    """Raise when a packed layout cannot fit the 64-bit register."""
+    if total_bits > 64:
+        raise ValueError(
+            f"Corpus requires {total_bits} bits, exceeding 64-bit register. "
+            f"Consider filtering corpus or using multi-register extension."
+        )
+
+
+def _canonical_key(word: str) -> bytes:
+    """Lowercased, letters-only ASCII bytes of a word.
+
+    Anagram-equivalent inputs that differ only in case or punctuation
+    share a key, which is what makes the hash caches effective.
+    """
+    return word.encode('ascii', 'ignore').translate(_CASE_FOLD, _NON_ALPHA)
+
+# Shift values for the fixed 3-bits-per-letter layout used by quick_hash.
+_QUICK_SHIFTS = [1 << (i * 3) for i in range(26)]
+
+
+def _build_lut(shifts: List[int]) -> List[int]:
+    """Expand 26 per-letter shift values into a 256-entry byte-indexed LUT.
+
+    Both cases of each letter map to its shift and every other byte maps
+    to 0, so the hash loop is a single list index and add per byte.
+    """
+    lut = [0] * 256
+    for i, v in enumerate(shifts):
+        lut[97 + i] = v
+        lut[65 + i] = v
+    return lut
+
+
+_QUICK_LUT = _build_lut(_QUICK_SHIFTS)
+
+
+def _specialize_hash(lut: List[int]):
+    """Generate a hash function with the LUT baked in as a constant.
+
+    The table is frozen into a tuple bound as a default argument, so the
+    loop reads it via LOAD_FAST with no attribute lookup per call and the
+    per-instance offsets are partially evaluated away.
+    """
+    def _hash(b: bytes, _lut=tuple(lut)) -> int:
+        h = 0
+        if len(b) > 32:
+            # Long words repeat letters; Counter does the per-byte pass in
+            # C and leaves at most ~52 multiply-adds here.
+            for c, n in Counter(b).items():
+                h += _lut[c] * n
+            return h
+        for c in b:
+            h += _lut[c]
+        return h
+    return _hash
 
 __version__ = "1.0.0"
 __author__ = "Nicholas David Brown"
@@ -36,16 +170,37 @@ class PackedAnagramHasher:
         Args:
             corpus: Iterable of words to analyze for max letter frequencies
         """
-        # Find maximum frequency per letter across corpus
-        max_freq = [0] * 26
-        
-        for word in corpus:
-            counts = [0] * 26
-            for c in word.lower():
-                if 'a' <= c <= 'z':
-                    counts[ord(c) - ord('a')] += 1
-            for i in range(26):
-                max_freq[i] = max(max_freq[i], counts[i])
+        # Find maximum frequency per letter across corpus.  The bit budget
+        # is re-checked whenever a maximum grows, so a corpus that cannot
+        # fit the register aborts the scan immediately instead of after
+        # walking every remaining word.
+        if _np is not None:
+            mf = _np.zeros(26, dtype=_np.int64)
+            for word in corpus:
+                a = _np.frombuffer(
+                    word.encode('ascii', 'ignore'), _np.uint8
+                ) | 0x20
+                a = a[(a >= 97) & (a <= 122)] - 97
+                counts = _np.bincount(a, minlength=26)
+                if _np.any(counts > mf):
+                    _np.maximum(mf, counts, out=mf)
+                    _check_bit_budget(_bit_budget(mf))
+            max_freq = [int(f) for f in mf]
+        else:
+            max_freq = [0] * 26
+            for word in corpus:
+                counts = [0] * 26
+                for c in word.encode('ascii', 'ignore'):
+                    c |= 0x20
+                    if 97 <= c <= 122:
+                        counts[c - 97] += 1
+                changed = False
+                for i in range(26):
+                    if counts[i] > max_freq[i]:
+                        max_freq[i] = counts[i]
+                        changed = True
+                if changed:
+                    _check_bit_budget(_bit_budget(max_freq))
         
         # Ensure at least 1 bit per letter that appears
         # (bit_length of 0 is 0, but we need at least 1 bit to represent presence)
@@ -54,21 +209,52 @@ class PackedAnagramHasher:
             for freq in max_freq
         ]
         
-        # Compute cumulative offsets
-        self.offsets = [0] * 26
+        # Compute cumulative offsets; stored as a compact byte array
+        # (all offsets are < 64) with C-level indexed access.
+        offsets = [0] * 26
         offset = 0
         for i in range(26):
-            self.offsets[i] = offset
+            offsets[i] = offset
             offset += self.bit_widths[i]
-        
+        self.offsets = array('B', offsets)
+
         self.total_bits = offset
-        
-        if self.total_bits > 64:
-            raise ValueError(
-                f"Corpus requires {self.total_bits} bits, exceeding 64-bit register. "
-                f"Consider filtering corpus or using multi-register extension."
-            )
-    
+
+        _check_bit_budget(self.total_bits)
+
+        # Per-letter shift values: one list index replaces the
+        # ``1 << self.offsets[i]`` shift per character.
+        self._shift_cache = [1 << o for o in self.offsets]
+
+        # Byte-indexed LUT folding case handling, letter filtering and the
+        # shift into one lookup per byte of ASCII input, plus a hash
+        # function specialized on it for the pure-Python path.
+        self._lut = _build_lut(self._shift_cache)
+        self._hash_py = _specialize_hash(self._lut)
+
+        # Precomputed shift values as a uint64 buffer, materialized once
+        # and shared zero-copy across every backend: the C/Cython
+        # extensions read it through the buffer protocol, the numba and
+        # numpy kernels through the read-only ndarray view over the same
+        # memory, and the pure-Python path through _shift_cache.  Only
+        # valid when every shift fits in 64 bits (letters past the budget
+        # end would need bit 64 for a zero-width tail).
+        self._shifts = None
+        self._shifts_np = None
+        if max(self.offsets) < 64:
+            self._shifts = array('Q', self._shift_cache)
+            if _np is not None:
+                self._shifts_np = _np.frombuffer(
+                    self._shifts, dtype=_np.uint64
+                )
+                self._shifts_np.flags.writeable = False
+
+        # Real corpora repeat words (Zipf); memoize on the canonical key
+        # so duplicates skip the hash entirely.
+        self._hash_cached = functools.lru_cache(maxsize=1 << 17)(
+            self._hash_bytes
+        )
+
     def hash(self, word: str) -> int:
         """
         Compute packed bit-width hash for a word.
@@ -79,13 +265,72 @@ class PackedAnagramHasher:
         Returns:
             64-bit integer hash where anagrams produce identical values
         """
-        h = 0
-        for c in word.lower():
-            if 'a' <= c <= 'z':
-                i = ord(c) - ord('a')
-                h += (1 << self.offsets[i])
-        return h
-    
+        key = _canonical_key(word)
+        return self._hash_cached(key)
+
+    def _hash_bytes(self, b: bytes) -> int:
+        """Hash canonical ASCII bytes via the fastest available backend."""
+        if self._shifts is not None:
+            # The compiled backends consume any uint64 buffer, so they do
+            # not depend on numpy being installed.
+            if _simd is not None:
+                return int(_simd.packed_hash(b, self._shifts))
+            if _chasher is not None:
+                return int(_chasher.packed_hash(b, self._shifts))
+            if _rust is not None:
+                return int(_rust.packed_hash(b, self._shift_cache))
+        if self._shifts_np is not None:
+            if _packed_hash_nb is not None:
+                return int(_packed_hash_nb(
+                    _np.frombuffer(b, _np.uint8), self._shifts_np
+                ))
+            # Long words amortize the NumPy dispatch overhead; short words
+            # are faster through the plain Python loop.
+            if len(b) > 8:
+                return self._hash_vectorized(b)
+        return self._hash_py(b)
+
+    def _hash_vectorized(self, b: bytes) -> int:
+        """Hash canonical bytes via NumPy bincount (C-level per-byte loop)."""
+        a = _np.frombuffer(b, _np.uint8) | 0x20
+        a = a[(a >= 97) & (a <= 122)] - 97
+        counts = _np.bincount(a, minlength=26)
+        return int(counts.astype(_np.uint64) @ self._shifts_np)
+
+    def hash_bulk(self, words: Iterable[str]) -> "_np.ndarray":
+        """
+        Compute packed hashes for many words at once.
+
+        Requires numpy.  Anagram-equivalent words map to equal entries,
+        so the result can be grouped or compared wholesale.
+
+        Args:
+            words: Iterable of words to hash
+
+        Returns:
+            numpy uint64 array of hashes, one per word, in input order
+        """
+        if self._shifts_np is None:
+            raise ImportError(
+                "hash_bulk requires numpy (pip install numpy); "
+                "use hash() for the pure-Python path"
+            )
+        encoded = [w.encode('ascii', 'ignore') for w in words]
+        n = len(encoded)
+        if n == 0:
+            return _np.empty(0, dtype=_np.uint64)
+        # One flat byte buffer for the whole batch: fold case, mask to
+        # letters, and scatter-add into an N x 26 count matrix, so the
+        # entire batch is hashed without a per-word Python loop.
+        lens = _np.fromiter((len(b) for b in encoded), dtype=_np.int64,
+                            count=n)
+        row = _np.repeat(_np.arange(n), lens)
+        col = _np.frombuffer(b"".join(encoded), _np.uint8) | 0x20
+        mask = (col >= 97) & (col <= 122)
+        counts = _np.zeros((n, 26), dtype=_np.uint64)
+        _np.add.at(counts, (row[mask], col[mask] - 97), 1)
+        return counts @ self._shifts_np
+
     def are_anagrams(self, word1: str, word2: str) -> bool:
         """
         Check if two words are anagrams.
@@ -97,7 +342,13 @@ class PackedAnagramHasher:
         Returns:
             True if words contain same letters (case-insensitive)
         """
-        return self.hash(word1) == self.hash(word2)
+        # Anagrams must have the same letter count; checking that first
+        # rejects most negatives without computing either hash.
+        k1 = _canonical_key(word1)
+        k2 = _canonical_key(word2)
+        if len(k1) != len(k2):
+            return False
+        return self._hash_cached(k1) == self._hash_cached(k2)
     
     def group_anagrams(self, words: Iterable[str]) -> Dict[int, List[str]]:
         """
@@ -109,12 +360,46 @@ class PackedAnagramHasher:
         Returns:
             Dictionary mapping hash -> list of anagram words
         """
-        groups: Dict[int, List[str]] = defaultdict(list)
+        words = list(words)
+        if self._shifts_np is not None and words:
+            # Hash everything in one vectorized pass, then bucket with a
+            # stable sort instead of N dict-hash/append operations.
+            hashes = self.hash_bulk(words)
+            order = _np.argsort(hashes, kind='stable')
+            sh = hashes[order]
+            starts = _np.flatnonzero(_np.r_[True, sh[1:] != sh[:-1]])
+            ends = _np.r_[starts[1:], len(sh)]
+            groups: Dict[int, List[str]] = {}
+            for s, e in zip(starts, ends):
+                groups[int(sh[s])] = [words[i] for i in order[s:e]]
+            return groups
+        result: Dict[int, List[str]] = defaultdict(list)
         for word in words:
-            h = self.hash(word)
-            groups[h].append(word)
-        return dict(groups)
+            result[self.hash(word)].append(word)
+        return dict(result)
     
+    def find_anagrams(self, query: str, candidates: Iterable[str]) -> List[int]:
+        """
+        Find all anagrams of a query word among candidates.
+
+        With numpy the candidates are hashed in bulk and matched against
+        the query hash in a single vectorized equality pass.
+
+        Args:
+            query: Word to match against
+            candidates: Iterable of candidate words
+
+        Returns:
+            Indices of the candidates that are anagrams of query,
+            in input order
+        """
+        candidates = list(candidates)
+        hq = self.hash(query)
+        if self._shifts_np is not None and candidates:
+            hashes = self.hash_bulk(candidates)
+            return [int(i) for i in _np.flatnonzero(hashes == _np.uint64(hq))]
+        return [i for i, w in enumerate(candidates) if self.hash(w) == hq]
+
     def __repr__(self) -> str:
         return f"PackedAnagramHasher(total_bits={self.total_bits})"
 
@@ -134,11 +419,30 @@ def quick_hash(word: str) -> int:
     Returns:
         Integer hash where anagrams produce identical values
     """
+    return _quick_hash_cached(_canonical_key(word))
+
+
+@functools.lru_cache(maxsize=1 << 17)
+def _quick_hash_cached(key: bytes) -> int:
+    """quick_hash on a canonical key, memoized for repeated words."""
+    if _letter_counts_nb is not None:
+        # JIT path: count letters in compiled code, then fold the (up to 26)
+        # counts into the 78-bit hash with arbitrary-precision Python ints.
+        counts = _letter_counts_nb(_np.frombuffer(key, _np.uint8))
+        h = 0
+        for i in range(26):
+            n = int(counts[i])
+            if n:
+                h += n << (i * 3)
+        return h
+    lut = _QUICK_LUT
     h = 0
-    for c in word.lower():
-        if 'a' <= c <= 'z':
-            i = ord(c) - ord('a')
-            h += (1 << (i * 3))
+    if len(key) > 32:
+        for c, n in Counter(key).items():
+            h += lut[c] * n
+        return h
+    for c in key:
+        h += lut[c]
     return h
 
 
@@ -153,4 +457,8 @@ def are_anagrams(word1: str, word2: str) -> bool:
     Returns:
         True if words are anagrams
     """
-    return quick_hash(word1) == quick_hash(word2)
+    k1 = _canonical_key(word1)
+    k2 = _canonical_key(word2)
+    if len(k1) != len(k2):
+        return False
+    return _quick_hash_cached(k1) == _quick_hash_cached(k2)
@@ -53,6 +53,9 @@ class TestPackedAnagramHasher:
         assert hasher.are_anagrams("listen", "silent")
         assert not hasher.are_anagrams("store", "stare")
         assert not hasher.are_anagrams("cat", "dog")
+        # Length pre-check must count letters only, not punctuation.
+        assert hasher.are_anagrams("c-a-t!", "act")
+        assert not hasher.are_anagrams("cat", "cats")
     
     def test_group_anagrams(self, hasher, sample_corpus):
         """group_anagrams should correctly cluster words."""
@@ -76,6 +79,38 @@ class TestPackedAnagramHasher:
         """Total bits should fit in 64-bit register."""
         assert hasher.total_bits <= 64
     
+    def test_group_anagrams_empty(self, hasher):
+        """Grouping nothing should return an empty dict."""
+        assert hasher.group_anagrams([]) == {}
+
+    def test_group_anagrams_preserves_order(self, hasher):
+        """Words within a group should keep their input order."""
+        groups = hasher.group_anagrams(["tac", "cat", "dog", "act"])
+        assert groups[hasher.hash("cat")] == ["tac", "cat", "act"]
+
+    def test_find_anagrams(self, hasher, sample_corpus):
+        """find_anagrams should return matching candidate indices."""
+        indices = hasher.find_anagrams("store", sample_corpus)
+        assert [sample_corpus[i] for i in indices] == [
+            "store", "rotes", "tores", "stroe"
+        ]
+        assert hasher.find_anagrams("cat", ["dog", "TAC", "act!"]) == [1, 2]
+        assert hasher.find_anagrams("store", []) == []
+
+    def test_hash_bulk_matches_scalar(self, hasher, sample_corpus):
+        """hash_bulk should agree with hash() for every word."""
+        pytest.importorskip("numpy")
+        hashes = hasher.hash_bulk(sample_corpus)
+        assert len(hashes) == len(sample_corpus)
+        for word, h in zip(sample_corpus, hashes):
+            assert int(h) == hasher.hash(word)
+
+    def test_vectorized_path_matches_loop(self, hasher):
+        """Long words (vectorized path) should match short-word hashing."""
+        # "storestore" takes the vectorized path; sum of two "store" hashes
+        # through the scalar path must be identical.
+        assert hasher.hash("storestore") == 2 * hasher.hash("store")
+
     def test_non_alpha_ignored(self, hasher):
         """Non-alphabetic characters should be ignored."""
         assert hasher.hash("store") == hasher.hash("s-t-o-r-e")
@@ -126,6 +161,24 @@ class TestEdgeCases:
         h = hasher.hash(corpus[0])
         assert h > 0
     
+    def test_bit_budget_exceeded(self):
+        """Corpora needing more than 64 bits should raise ValueError."""
+        alphabet = "abcdefghijklmnopqrstuvwxyz"
+        with pytest.raises(ValueError, match="64-bit register"):
+            PackedAnagramHasher([alphabet * 8])
+        # The over-budget word should abort even when followed by more
+        # corpus; an iterator makes any full scan observable.
+        consumed = []
+
+        def corpus():
+            for w in [alphabet * 8] + ["filler"] * 1000:
+                consumed.append(w)
+                yield w
+
+        with pytest.raises(ValueError):
+            PackedAnagramHasher(corpus())
+        assert len(consumed) == 1
+
     def test_repr(self):
         """__repr__ should be informative."""
         hasher = PackedAnagramHasher(["test"])